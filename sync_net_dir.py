@@ -4,11 +4,14 @@
 import argparse
 import fnmatch
 import os
+import re
 import shutil
+import stat
 import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Tuple, Dict, Set
+from typing import Callable, Iterable, List, Tuple, Dict, FrozenSet, Set, TextIO
 
 try:
     import yaml
@@ -16,27 +19,139 @@ except ImportError:
     print("Missing dependency: pyyaml. Install with: pip install pyyaml", file=sys.stderr)
     sys.exit(2)
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 IS_WINDOWS = os.name == "nt"
+STAT_WORKERS = 1  # planning stats run inline unless more workers are requested
+STAT_BATCH = 256  # files decided at a time, so entries and futures are freed as the walk goes
+COPY_WORKERS = 8  # concurrent copies; SMB throughput is latency-bound
+
+if IS_WINDOWS:
+    import ctypes
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _CopyFileExW = _kernel32.CopyFileExW
+    _CopyFileExW.argtypes = (
+        wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_void_p, ctypes.c_void_p,
+        ctypes.POINTER(wintypes.BOOL), wintypes.DWORD,
+    )
+    _CopyFileExW.restype = wintypes.BOOL
 
-def _to_long_path(p: str) -> str:
-    """Return Windows long-path prefixed path."""
+def _copy_file(src: str, dst: str) -> None:
+    """Copy file contents from src to dst, overwriting dst."""
     if not IS_WINDOWS:
-        return p
+        # copyfile already uses sendfile/fcopyfile on Linux/macOS
+        shutil.copyfile(src, dst)
+        return
+    # CopyFileExW streams in the kernel (server-side on SMB) and accepts \\?\ paths
+    if not _CopyFileExW(src, dst, None, None, None, 0):
+        err = ctypes.get_last_error()
+        raise OSError(None, ctypes.FormatError(err).strip(), src, err, dst)
+    # CopyFileExW carries over attributes; keep the copy writable like copyfile does
+    os.chmod(dst, stat.S_IREAD | stat.S_IWRITE)
+
+def _to_long_path_win(p: str) -> str:
+    """Return Windows long-path prefixed path."""
     if p.startswith("\\\\?\\"):
         return p
     if p.startswith("\\\\"):
         return "\\\\?\\UNC" + p[1:]
     return "\\\\?\\" + p
 
-@dataclass
+def _to_long_path_posix(p: str) -> str:
+    """Return p unchanged; long-path prefixes only exist on Windows."""
+    return p
+
+# Chosen once at import so hot paths do not re-check the platform per call
+_to_long_path = _to_long_path_win if IS_WINDOWS else _to_long_path_posix
+
+def _translate_path_glob(pat: str) -> str:
+    r"""Translate a backslash-separated glob to a regex; * ? and [...] stay within one component.
+
+    >>> rx = re.compile(_translate_path_glob("a\\b\\*.txt"))
+    >>> bool(rx.match("a\\b\\x.txt")), bool(rx.match("a\\b\\c\\deep.txt"))
+    (True, False)
+    >>> rx = re.compile(_translate_path_glob("a\\[!]x].txt"))
+    >>> bool(rx.match("a\\q.txt")), bool(rx.match("a\\].txt")), bool(rx.match("a\\\\.txt"))
+    (True, False, False)
+    >>> rx = re.compile(_translate_path_glob("a\\[a&&b]"))
+    >>> bool(rx.match("a\\&")), bool(rx.match("a\\b")), bool(rx.match("a\\c"))
+    (True, True, False)
+    """
+    out: List[str] = []
+    i, n = 0, len(pat)
+    while i < n:
+        c = pat[i]
+        i += 1
+        if c == "*":
+            out.append(r"[^\\]*")
+        elif c == "?":
+            out.append(r"[^\\]")
+        elif c == "[":
+            j = i + 1 if i < n and pat[i] == "!" else i
+            j = pat.find("]", j + 1 if j < n and pat[j] == "]" else j)
+            if j == -1:
+                out.append(r"\[")
+                continue
+            # Class body built as fnmatch.translate does: split on range hyphens,
+            # drop empty ranges, escape backslashes and literal hyphens
+            if "-" not in pat[i:j]:
+                body = pat[i:j].replace("\\", r"\\")
+            else:
+                chunks = []
+                k = i + 2 if pat[i] == "!" else i + 1
+                start = i
+                while True:
+                    k = pat.find("-", k, j)
+                    if k < 0:
+                        break
+                    chunks.append(pat[start:k])
+                    start = k + 1
+                    k = k + 3
+                chunk = pat[start:j]
+                if chunk:
+                    chunks.append(chunk)
+                else:
+                    chunks[-1] += "-"
+                for k in range(len(chunks) - 1, 0, -1):
+                    if chunks[k - 1][-1] > chunks[k][0]:
+                        chunks[k - 1] = chunks[k - 1][:-1] + chunks[k][1:]
+                        del chunks[k]
+                body = "-".join(part.replace("\\", r"\\").replace("-", r"\-") for part in chunks)
+            # Escape set operations (&&, ~~, ||) as fnmatch.translate does
+            body = re.sub(r"([&~|])", r"\\\1", body)
+            if not body:
+                out.append("(?!)")  # empty range: never matches
+            elif body == "!":
+                out.append(r"[^\\]")
+            else:
+                if body[0] == "!":
+                    body = "^" + body[1:]
+                elif body[0] in "^[":
+                    body = "\\" + body
+                # The lookahead keeps the separator out of negations and ranges
+                # without touching the class body
+                out.append(r"(?!\\)[" + body + "]")
+            i = j + 1
+        else:
+            out.append(re.escape(c))
+    return "(?s:" + "".join(out) + r")\Z"
+
+@dataclass(slots=True)
 class Excludes:
     """Exclude rules container."""
-    root_dirs: Set[str]
-    recursive_dirs: Set[str]
+    root_dirs: FrozenSet[str]
+    recursive_dirs: FrozenSet[str]
     file_patterns: List[str]
     specific_paths: List[str]
+    bname_patterns: List[str]
+    path_patterns: List[str]
 
-@dataclass
+@dataclass(slots=True)
 class JobConfig:
     """Job configuration holder."""
     source_dir: Path
@@ -47,14 +162,17 @@ class JobConfig:
     def from_yaml(path: Path) -> "JobConfig":
         """Load configuration from YAML."""
         with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YamlLoader) or {}
         for key in ("source_dir", "dest_dir"):
             if key not in data or not data[key]:
                 raise ValueError(f"Missing required key: {key}")
         excl = data.get("excludes", {}) or {}
-        root_dirs = set(map(str.lower, (excl.get("root_dirs") or [])))
-        recursive_dirs = set(map(str.lower, (excl.get("recursive_dirs") or [])))
+        root_dirs = frozenset(sys.intern(str(d).lower()) for d in (excl.get("root_dirs") or []))
+        recursive_dirs = frozenset(sys.intern(str(d).lower()) for d in (excl.get("recursive_dirs") or []))
         file_patterns = list(excl.get("file_patterns") or [])
+        # Patterns with a separator match the relative path; the rest match the basename
+        bname_patterns = [p.lower() for p in file_patterns if "/" not in p and "\\" not in p]
+        path_patterns = [p.replace("/", "\\").lower() for p in file_patterns if "/" in p or "\\" in p]
         specific_paths = [str(p).replace("/", "\\").lower() for p in (excl.get("specific_paths") or [])]
         return JobConfig(
             source_dir=Path(data["source_dir"]),
@@ -64,109 +182,218 @@ class JobConfig:
                 recursive_dirs=recursive_dirs,
                 file_patterns=file_patterns,
                 specific_paths=specific_paths,
+                bname_patterns=bname_patterns,
+                path_patterns=path_patterns,
             ),
         )
 
-@dataclass
+@dataclass(slots=True)
 class PlanItem:
     """Planned file operation."""
     action: str  # "ADD", "UPDATE", "SKIP", "EXCLUDE"
-    src: Path
-    dst: Path
+    src: str
+    dst: str
     reason: str = ""
+    src_long: str = ""  # long-path form, filled by the planner for copy items
+    dst_long: str = ""
 
 class SyncPlanner:
     """Plan sync operations using size+mtime."""
-    def __init__(self, cfg: JobConfig, verbose: bool = False):
+    def __init__(self, cfg: JobConfig, verbose: bool = False, stat_workers: int = STAT_WORKERS, record_skips: bool = True):
         """Initialize planner."""
         self.cfg = cfg
         self.verbose = verbose
-        self.src_root = cfg.source_dir.resolve()
-        self.dst_root = cfg.dest_dir.resolve()
-        self._root_excl = cfg.excludes.root_dirs
-        self._rec_excl = cfg.excludes.recursive_dirs
-        self._file_patterns = [p.lower() for p in cfg.excludes.file_patterns]
+        self.stat_workers = max(1, stat_workers)
+        self._pool: ThreadPoolExecutor | None = None
+        self.record_skips = record_skips
+        # Per-action counts of planned items left out of the returned list
+        self.omitted: Dict[str, int] = {}
+        # Per-reason counts of excluded paths when not verbose
+        self.exclude_counts: Dict[str, int] = {}
+        # abspath normalizes without realpath's per-component stats on network paths
+        self.src_root = Path(os.path.abspath(cfg.source_dir))
+        self.dst_root = Path(os.path.abspath(cfg.dest_dir))
+        # Directory-name classification tables; root-only rules win at the top level
+        self._any_dir_reasons: Dict[str, str] = dict.fromkeys(cfg.excludes.recursive_dirs, "recursive_dir")
+        self._root_dir_reasons: Dict[str, str] = {
+            **self._any_dir_reasons,
+            **dict.fromkeys(cfg.excludes.root_dirs, "root_dir"),
+        }
         self._specific_excl = cfg.excludes.specific_paths
+        self._bname_re = self._compile_patterns(cfg.excludes.bname_patterns)
+        self._path_re = self._compile_patterns(cfg.excludes.path_patterns, _translate_path_glob)
+        self._specific_remaining: Set[str] = set()
+        self._specific_prefixes = tuple(sp + "\\" for sp in self._specific_excl)
+        # Root prefixes ending in exactly one separator; paths are built by concatenation
+        self._src_prefix = str(self.src_root).rstrip(os.sep) + os.sep
+        self._dst_prefix = str(self.dst_root).rstrip(os.sep) + os.sep
 
     def plan(self) -> List[PlanItem]:
         """Build the sync plan."""
         if not self.src_root.exists():
             raise FileNotFoundError(f"Source not found: {self.src_root}")
         items: List[PlanItem] = []
+        self._specific_remaining = set(self._specific_excl)
+        self.omitted = {}
+        self.exclude_counts = {}
+        # Threads only pay off where stat is a syscall that can block on the
+        # network (POSIX mounts); Windows scandir entries already carry size+mtime
+        if self.stat_workers > 1 and not IS_WINDOWS:
+            with ThreadPoolExecutor(max_workers=self.stat_workers) as pool:
+                self._pool = pool
+                try:
+                    self._walk("", "", items)
+                finally:
+                    self._pool = None
+        else:
+            self._walk("", "", items)
+        if self.exclude_counts:
+            self.omitted["EXCLUDE"] = sum(self.exclude_counts.values())
+        return items
 
-        for dirpath, dirnames, filenames in os.walk(self._long(self.src_root)):
-            dirpath_path = Path(self._short(Path(dirpath)))
-            rel_dir = dirpath_path.relative_to(self.src_root)
-
-            # Specific path pruning (e.g., 'scripts\\output'); record exclusion
-            if self._is_under_specific(rel_dir):
-                items.append(PlanItem(
-                    "EXCLUDE",
-                    dirpath_path,
-                    self.dst_root / rel_dir,
-                    reason="specific_path"
-                ))
-                dirnames[:] = []
-                filenames[:] = []
+    def _add_decided(
+        self,
+        items: List[PlanItem],
+        batch: List[Tuple[os.DirEntry, os.DirEntry | None, str, str]],
+    ) -> None:
+        """Decide a batch of files and append them to items, only counting SKIPs when not recorded."""
+        srcs = [b[0] for b in batch]
+        dsts = [b[1] for b in batch]
+        if self._pool is not None:
+            decisions = self._pool.map(self._decide, srcs, dsts)
+        else:
+            decisions = map(self._decide, srcs, dsts)
+        skipped = 0
+        for (_, _, src_file, dst_file), (act, reason) in zip(batch, decisions):
+            if act == "SKIP" and not self.record_skips:
+                skipped += 1
                 continue
-
-            # Root-only excludes: remove from traversal and record them
-            if rel_dir == Path("."):
-                lowered = [d.lower() for d in dirnames]
-                keep, removed = [], []
-                for name, low in zip(dirnames, lowered):
-                    if low in self._root_excl:
-                        removed.append(name)
-                    else:
-                        keep.append(name)
-                if removed:
-                    for r in removed:
-                        src_d = dirpath_path / r
-                        dst_d = self.dst_root / r
-                        items.append(PlanItem("EXCLUDE", src_d, dst_d, reason="root_dir"))
-                dirnames[:] = keep
-
-            # Recursive excludes: remove from traversal and record them
-            if dirnames:
-                lowered = [d.lower() for d in dirnames]
-                keep, removed = [], []
-                for name, low in zip(dirnames, lowered):
-                    if low in self._rec_excl:
-                        removed.append(name)
+            items.append(PlanItem(
+                act,
+                src_file,
+                dst_file,
+                reason=reason,
+                src_long=_to_long_path(src_file),
+                dst_long=_to_long_path(dst_file),
+            ))
+        if skipped:
+            self.omitted["SKIP"] = self.omitted.get("SKIP", 0) + skipped
+
+    def _walk(
+        self,
+        rel_dir: str,
+        rel_key: str,
+        items: List[PlanItem],
+        dst_exists: bool = True,
+    ) -> None:
+        """Scan one source directory and recurse into kept subdirectories.
+
+        dst_exists=False means the mirrored destination directory is known to be
+        missing, so no destination lookups are made for this subtree.
+        """
+        # rel_dir is "" at the root, otherwise "a<sep>b" with no trailing separator;
+        # rel_key is the same path lowercased with backslashes, built once per level
+        src_base = self._src_prefix + rel_dir + os.sep if rel_dir else self._src_prefix
+        dst_base = self._dst_prefix + rel_dir + os.sep if rel_dir else self._dst_prefix
+        dirs: List[os.DirEntry] = []
+        files: List[os.DirEntry] = []
+        try:
+            with os.scandir(self._long(src_base)) as it:
+                # Classify as os.walk does: anything that is not a directory is a
+                # file, so broken links reach _decide and are reported as unreadable
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        # e.g. a symlink loop: not a directory, as in os.walk
+                        is_dir = False
+                    if is_dir:
+                        dirs.append(entry)
                     else:
-                        keep.append(name)
-                if removed:
-                    for r in removed:
-                        src_d = dirpath_path / r
-                        dst_d = self.dst_root / rel_dir / r
-                        items.append(PlanItem("EXCLUDE", src_d, dst_d, reason="recursive_dir"))
-                dirnames[:] = keep
-
-            # Files in this directory
-            for fname in filenames:
-                src_file = Path(dirpath_path) / fname
-                rel_file = src_file.relative_to(self.src_root)
-                dst_file = self.dst_root / rel_file
-
-                if self._is_file_excluded(fname):
-                    items.append(PlanItem("EXCLUDE", src_file, dst_file, reason="pattern"))
-                    continue
-
-                act, reason = self._decide(src_file, dst_file)
-                items.append(PlanItem(act, src_file, dst_file, reason=reason))
+                        files.append(entry)
+        except OSError:
+            # Unreadable directories are skipped, as os.walk did
+            return
+
+        # Directory excludes: root-only, recursive, then specific paths
+        dir_reasons = self._root_dir_reasons if not rel_dir else self._any_dir_reasons
+        keep: List[Tuple[str, str]] = []
+        for entry in dirs:
+            name = entry.name
+            low = name.lower()
+            reason = dir_reasons.get(low)
+            if reason is not None:
+                self._exclude(items, src_base + name, dst_base + name, reason)
+                continue
+            rel_d = rel_dir + os.sep + name if rel_dir else name
+            key_d = rel_key + "\\" + low if rel_key else low
+            if self._is_under_specific(key_d):
+                self._exclude(items, src_base + name, dst_base + name, "specific_path")
+                continue
+            try:
+                is_link = entry.is_symlink()
+            except OSError:
+                # Treated as a plain directory, as os.walk does
+                is_link = False
+            if is_link:
+                # Linked directories are listed but not descended, as os.walk did
+                continue
+            keep.append((rel_d, key_d))
 
-        return items
+        # Snapshot the destination directory once instead of stat'ing each file
+        dst_index: Dict[str, os.DirEntry] = {}
+        if dst_exists and (files or keep):
+            try:
+                with os.scandir(self._long(dst_base)) as it:
+                    dst_index = {os.path.normcase(e.name): e for e in it}
+            except (FileNotFoundError, NotADirectoryError):
+                # Nothing below a missing destination exists either: ADD-only subtree
+                dst_exists = False
+            except OSError:
+                # Unlistable destination: every file plans as ADD
+                pass
+
+        # Files in this directory, decided in bounded batches before recursing
+        batch: List[Tuple[os.DirEntry, os.DirEntry | None, str, str]] = []
+        for entry in files:
+            fname = entry.name
+            src_file = src_base + fname
+            dst_file = dst_base + fname
+
+            if self._is_file_excluded(fname, rel_key):
+                self._exclude(items, src_file, dst_file, "pattern")
+                continue
 
-    def _decide(self, src: Path, dst: Path) -> Tuple[str, str]:
-        """Decide action for a file."""
+            batch.append((entry, dst_index.get(os.path.normcase(fname)), src_file, dst_file))
+            if len(batch) >= STAT_BATCH:
+                self._add_decided(items, batch)
+                batch = []
+        if batch:
+            self._add_decided(items, batch)
+
+        # Release this level's entries before descending
+        del dirs, files, batch, dst_index
+        for rel_d, key_d in keep:
+            self._walk(rel_d, key_d, items, dst_exists)
+
+    def _exclude(self, items: List[PlanItem], src: str, dst: str, reason: str) -> None:
+        """Record an excluded path; only counted by reason unless verbose."""
+        if self.verbose:
+            items.append(PlanItem("EXCLUDE", src, dst, reason=reason))
+        else:
+            self.exclude_counts[reason] = self.exclude_counts.get(reason, 0) + 1
+
+    def _decide(self, src_entry: os.DirEntry, dst_entry: os.DirEntry | None) -> Tuple[str, str]:
+        """Decide action for a file from its scandir entries (dst_entry None = missing)."""
         try:
-            s_stat = os.stat(self._long(src))
+            # DirEntry.stat() is cached; on Windows it comes free with the listing
+            s_stat = src_entry.stat()
         except OSError as e:
             return ("EXCLUDE", f"unreadable: {e}")
-        if not dst.exists():
+        if dst_entry is None:
             return ("ADD", "missing")
         try:
-            d_stat = os.stat(self._long(dst))
+            d_stat = dst_entry.stat()
         except OSError as e:
             return ("UPDATE", f"dst unreadable: {e}")
         size_same = s_stat.st_size == d_stat.st_size
@@ -175,75 +402,102 @@ class SyncPlanner:
             return ("SKIP", "same size+mtime")
         return ("UPDATE", f"size {'=' if size_same else '≠'}, mtime {'=' if mtime_same else '≠'}")
 
-    def _is_file_excluded(self, name: str) -> bool:
-        """Return True if file matches excluded patterns."""
-        n = name.lower()
-        for pat in self._file_patterns:
-            if fnmatch.fnmatch(n, pat):
-                return True
-        return False
-
-    def _is_under_specific(self, rel_dir: Path) -> bool:
-        """Return True if rel_dir equals/starts with any specific excluded path."""
-        if not self._specific_excl:
+    def _is_file_excluded(self, name: str, rel_key: str) -> bool:
+        """Return True if file matches excluded patterns (basename first, then relative path)."""
+        name_l = name.lower()
+        if self._bname_re is not None and self._bname_re.match(name_l):
+            return True
+        if self._path_re is None:
             return False
-        s = self._rel_str(rel_dir)
-        for sp in self._specific_excl:
-            if s == sp or s.startswith(sp + "\\"):
-                return True
-        return False
+        rel_file = rel_key + "\\" + name_l if rel_key else name_l
+        return self._path_re.match(rel_file) is not None
 
-    @staticmethod
-    def _long(p: Path | str) -> str:
-        """Return long-path form."""
-        return _to_long_path(str(p))
+    def _is_under_specific(self, rel_key: str) -> bool:
+        """Return True if rel_key equals/starts with any specific excluded path."""
+        if not self._specific_remaining:
+            return False
+        if rel_key in self._specific_remaining:
+            # The excluded subtree is never descended, so on a case-insensitive
+            # filesystem this rule cannot fire again; stop checking it.
+            if IS_WINDOWS:
+                self._specific_remaining.discard(rel_key)
+            return True
+        return rel_key.startswith(self._specific_prefixes)
 
     @staticmethod
-    def _short(p: Path) -> str:
-        """Strip long-path prefix for display."""
-        s = str(p)
-        if IS_WINDOWS and s.startswith("\\\\?\\UNC\\"):
-            return "\\" + s[7:]
-        if IS_WINDOWS and s.startswith("\\\\?\\"):
-            return s[4:]
-        return s
+    def _compile_patterns(
+        patterns: List[str], translate: Callable[[str], str] = fnmatch.translate
+    ) -> "re.Pattern[str] | None":
+        """Compile glob patterns into one alternation regex, or None if empty."""
+        if not patterns:
+            return None
+        return re.compile("(?:" + "|".join(translate(p) for p in patterns) + ")")
 
     @staticmethod
-    def _rel_str(p: Path) -> str:
-        """Return lowercase relative path with backslashes."""
-        return str(p).replace("/", "\\").lower()
+    def _long(p: Path | str) -> str:
+        """Return long-path form."""
+        return _to_long_path(str(p))
 
 class SyncApplier:
     """Apply planned file copies atomically."""
-    def __init__(self, preserve_mtime: bool = True):
+    def __init__(self, preserve_mtime: bool = True, workers: int = COPY_WORKERS):
         """Initialize applier."""
         self.preserve_mtime = preserve_mtime
+        self.workers = max(1, workers)
 
     def apply(self, items: Iterable[PlanItem]) -> None:
         """Execute adds and updates."""
-        for it in items:
-            if it.action in ("SKIP", "EXCLUDE"):
-                continue
-            it.dst.parent.mkdir(parents=True, exist_ok=True)
-            temp_path = it.dst.with_suffix(it.dst.suffix + ".part")
+        todo = [it for it in items if it.action not in ("SKIP", "EXCLUDE")]
+        # Create parent directories up front so copy workers never race on mkdir
+        for parent in sorted({os.path.dirname(it.dst_long or _to_long_path(it.dst)) for it in todo}):
+            os.makedirs(parent, exist_ok=True)
+        if self.workers == 1:
+            for it in todo:
+                self._copy_one(it)
+            return
+        # Sliding window: a new copy is submitted as soon as one finishes, so a
+        # large file never idles the other workers, and the queue stays bounded
+        window = 2 * self.workers
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            in_flight: Set[Future] = set()
             try:
-                shutil.copyfile(_to_long_path(str(it.src)), _to_long_path(str(temp_path)))
-                if self.preserve_mtime:
-                    s_stat = os.stat(_to_long_path(str(it.src)))
-                    os.utime(_to_long_path(str(temp_path)), (s_stat.st_atime, s_stat.st_mtime))
-                os.replace(_to_long_path(str(temp_path)), _to_long_path(str(it.dst)))
-            except PermissionError:
-                try:
-                    if os.path.exists(_to_long_path(str(temp_path))):
-                        os.remove(_to_long_path(str(temp_path)))
-                finally:
-                    raise
-            except OSError:
-                try:
-                    if os.path.exists(_to_long_path(str(temp_path))):
-                        os.remove(_to_long_path(str(temp_path)))
-                finally:
-                    raise
+                for it in todo:
+                    if len(in_flight) >= window:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for fut in done:
+                            fut.result()
+                    in_flight.add(pool.submit(self._copy_one, it))
+                for fut in as_completed(in_flight):
+                    fut.result()
+            except BaseException:
+                # First failure aborts the run; drop copies not yet started
+                for fut in in_flight:
+                    fut.cancel()
+                raise
+
+    def _copy_one(self, it: PlanItem) -> None:
+        """Copy one file via a .part temp file and atomically replace the target."""
+        src_long = it.src_long or _to_long_path(it.src)
+        dst_long = it.dst_long or _to_long_path(it.dst)
+        tmp_long = dst_long + ".part"
+        try:
+            _copy_file(src_long, tmp_long)
+            if self.preserve_mtime:
+                s_stat = os.stat(src_long)
+                os.utime(tmp_long, (s_stat.st_atime, s_stat.st_mtime))
+            os.replace(tmp_long, dst_long)
+        except PermissionError:
+            try:
+                if os.path.exists(tmp_long):
+                    os.remove(tmp_long)
+            finally:
+                raise
+        except OSError:
+            try:
+                if os.path.exists(tmp_long):
+                    os.remove(tmp_long)
+            finally:
+                raise
 
 def _fmt_list(lst: Iterable[str]) -> str:
     """Return comma-separated list or '(none)'."""
@@ -265,67 +519,68 @@ def format_config_summary(cfg: JobConfig) -> str:
     ]
     return "\n".join(lines)
 
-def format_plan(items: List[PlanItem], src_root: Path | None = None, dst_root: Path | None = None, compact: bool = False) -> str:
-    """Create human-readable plan summary."""
-    groups: Dict[str, List[PlanItem]] = {"ADD": [], "UPDATE": [], "SKIP": [], "EXCLUDE": []}
+_PLAN_BLOCKS = (
+    ("ADDED", "ADD"),
+    ("UPDATED", "UPDATE"),
+    ("SKIPPED (already up-to-date)", "SKIP"),
+    ("EXCLUDED (by pattern or pruned dir)", "EXCLUDE"),
+)
+
+def write_plan(
+    items: List[PlanItem],
+    out: TextIO,
+    src_root: Path | None = None,
+    dst_root: Path | None = None,
+    compact: bool = False,
+    omitted: Dict[str, int] | None = None,
+    exclude_counts: Dict[str, int] | None = None,
+) -> None:
+    """Write human-readable plan summary to out, one line at a time.
+
+    omitted holds per-action counts of items the planner did not record;
+    they are included in the totals but have no rows. exclude_counts gives
+    the per-reason breakdown listed under the EXCLUDE block.
+    """
+    counts: Dict[str, int] = {"ADD": 0, "UPDATE": 0, "SKIP": 0, "EXCLUDE": 0}
+    for action, n in (omitted or {}).items():
+        counts[action] = counts.get(action, 0) + n
     for it in items:
-        groups.setdefault(it.action, []).append(it)
+        counts[it.action] = counts.get(it.action, 0) + 1
+    total = sum(counts.values())
 
-    def rel(p: Path, root: Path | None) -> str:
-        try:
-            return str(p.relative_to(root)) if root else str(p)
-        except ValueError:
-            return str(p)
+    src_prefix = str(src_root).rstrip(os.sep) + os.sep if src_root else ""
 
-    lines: List[str] = []
-    total = sum(len(v) for v in groups.values())
+    def rel(p: str) -> str:
+        return p[len(src_prefix):] if src_prefix and p.startswith(src_prefix) else p
 
     if compact:
         if src_root:
-            lines.append(f"Source: {src_root}")
+            out.write(f"Source: {src_root}\n")
         if dst_root:
-            lines.append(f"Dest  : {dst_root}")
-        lines.append(
-            f"Plan  : add {len(groups['ADD'])} | update {len(groups['UPDATE'])} | "
-            f"skip {len(groups['SKIP'])} | exclude {len(groups['EXCLUDE'])}"
-        )
-        lines.append("")
-
-        def block(title: str, key: str):
-            rows = groups.get(key, [])
-            lines.append(f"{title} ({len(rows)})")
-            for it in rows:
-                lines.append(f"  - {rel(it.src, src_root)} [{it.reason}]")
-            lines.append("")
-
-        block("ADDED", "ADD")
-        block("UPDATED", "UPDATE")
-        block("SKIPPED (already up-to-date)", "SKIP")
-        block("EXCLUDED (by pattern or pruned dir)", "EXCLUDE")
-
-        lines.append(
-            f"Summary: total {total} | add {len(groups['ADD'])} | update {len(groups['UPDATE'])} | "
-            f"skip {len(groups['SKIP'])} | exclude {len(groups['EXCLUDE'])}"
+            out.write(f"Dest  : {dst_root}\n")
+        out.write(
+            f"Plan  : add {counts['ADD']} | update {counts['UPDATE']} | "
+            f"skip {counts['SKIP']} | exclude {counts['EXCLUDE']}\n\n"
         )
-        return "\n".join(lines)
-
-    def block_verbose(title: str, key: str):
-        rows = groups.get(key, [])
-        lines.append(f"{title} ({len(rows)})")
-        for it in rows:
-            lines.append(f"  - {key:7} {it.src}  →  {it.dst}  [{it.reason}]")
-        lines.append("")
-
-    block_verbose("ADDED", "ADD")
-    block_verbose("UPDATED", "UPDATE")
-    block_verbose("SKIPPED (already up-to-date)", "SKIP")
-    block_verbose("EXCLUDED (by pattern or pruned dir)", "EXCLUDE")
-
-    lines.append(
-        f"Summary: total {total} | add {len(groups['ADD'])} | update {len(groups['UPDATE'])} | "
-        f"skip {len(groups['SKIP'])} | exclude {len(groups['EXCLUDE'])}"
+
+    for title, key in _PLAN_BLOCKS:
+        out.write(f"{title} ({counts[key]})\n")
+        for it in items:
+            if it.action != key:
+                continue
+            if compact:
+                out.write(f"  - {rel(it.src)} [{it.reason}]\n")
+            else:
+                out.write(f"  - {key:7} {it.src}  →  {it.dst}  [{it.reason}]\n")
+        if key == "EXCLUDE" and exclude_counts:
+            for reason in sorted(exclude_counts):
+                out.write(f"  - {exclude_counts[reason]} [{reason}]\n")
+        out.write("\n")
+
+    out.write(
+        f"Summary: total {total} | add {counts['ADD']} | update {counts['UPDATE']} | "
+        f"skip {counts['SKIP']} | exclude {counts['EXCLUDE']}\n"
     )
-    return "\n".join(lines)
 
 def main():
     """Parse args, plan, and optionally apply."""
@@ -334,6 +589,8 @@ def main():
     parser.add_argument("--apply", action="store_true", help="Apply changes (copy). Omit for dry-run.")
     parser.add_argument("--verbose", action="store_true", help="Verbose output.")
     parser.add_argument("--compact", action="store_true", help="Compact output: show relative paths and summarize roots.")
+    parser.add_argument("--stat-workers", type=int, default=STAT_WORKERS, help="Threads for planning stat calls on POSIX network mounts (default 1: inline).")
+    parser.add_argument("--workers", type=int, default=COPY_WORKERS, help=f"Concurrent file copies when applying (default {COPY_WORKERS}).")
     args = parser.parse_args()
 
     try:
@@ -346,20 +603,34 @@ def main():
     if not args.compact:
         print(format_config_summary(cfg))
 
-    planner = SyncPlanner(cfg, verbose=args.verbose)
+    # Skipped files are only listed in verbose or compact output
+    planner = SyncPlanner(
+        cfg,
+        verbose=args.verbose,
+        stat_workers=args.stat_workers,
+        record_skips=args.verbose or args.compact,
+    )
     try:
         plan = planner.plan()
     except Exception as e:
         print(f"Planning failed: {e}", file=sys.stderr)
         sys.exit(1)
 
-    print(format_plan(plan, src_root=planner.src_root, dst_root=planner.dst_root, compact=args.compact))
+    write_plan(
+        plan,
+        sys.stdout,
+        src_root=planner.src_root,
+        dst_root=planner.dst_root,
+        compact=args.compact,
+        omitted=planner.omitted,
+        exclude_counts=planner.exclude_counts,
+    )
 
     if not args.apply:
         return
 
     to_apply = [it for it in plan if it.action in ("ADD", "UPDATE")]
-    applier = SyncApplier(preserve_mtime=True)
+    applier = SyncApplier(preserve_mtime=True, workers=args.workers)
     try:
         applier.apply(to_apply)
     except PermissionError as e: